@@ -14,15 +14,18 @@ Note:
 from __future__ import annotations
 
 import argparse
+import math
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Tuple
 
 from openpyxl import load_workbook
 
 import sys
 sys.path.append(str(Path(__file__).resolve().parent))
 
-from engine.bond_engine import BondSpec, FlatYield, build_flat_curve, cashflows, price_from_curve, price, macaulay_duration, modified_duration_flat, convexity_flat
+from engine.bond_engine import BondSpec, FlatYield, build_flat_curve, cashflows, price_from_curve, metrics_flat
+from engine.excel_io import column_values
 
 
 @dataclass(frozen=True)
@@ -34,18 +37,31 @@ class ExcelOutputs:
 
 
 def read_excel_outputs(xlsx_path: str, sheet: str = "Bond Toolkit") -> ExcelOutputs:
-    wb = load_workbook(xlsx_path, data_only=True)
-    ws = wb[sheet]
-    return ExcelOutputs(
-        price=float(ws["B13"].value),
-        mac_dur=float(ws["B14"].value),
-        mod_dur=float(ws["B15"].value),
-        convexity=float(ws["B16"].value),
-    )
+    wb = load_workbook(xlsx_path, data_only=True, read_only=True)
+    try:
+        return _read_outputs(_read_block(wb[sheet]))
+    finally:
+        wb.close()
+
+
+def _read_block(ws) -> list:
+    """B5:B16 in one pass: inputs B5:B10, (B11:B12 unused), cached outputs B13:B16."""
+    return column_values(ws, 5, 16)
+
+
+def _read_inputs(vals: list) -> Tuple[BondSpec, FlatYield]:
+    fv, c, T, p, j, m = vals[:6]
+    bond = BondSpec(fv=float(fv), coupon_rate=float(c), maturity=float(T), coupon_freq=int(p))
+    return bond, FlatYield(j=float(j), m=int(m))
+
+
+def _read_outputs(vals: list) -> ExcelOutputs:
+    price, mac, mod, conv = vals[8:12]
+    return ExcelOutputs(price=float(price), mac_dur=float(mac), mod_dur=float(mod), convexity=float(conv))
 
 
 def close(a: float, b: float, rel: float = 1e-9, abs_: float = 1e-6) -> bool:
-    return abs(a - b) <= max(abs_, rel * max(abs(a), abs(b)))
+    return math.isclose(a, b, rel_tol=rel, abs_tol=abs_)
 
 
 def main():
@@ -57,25 +73,19 @@ def main():
 
     xlsx_path = Path(args.xlsx).resolve()
 
-    wb = load_workbook(str(xlsx_path), data_only=True)
-    ws = wb["Bond Toolkit"]
-    bond = BondSpec(
-        fv=float(ws["B5"].value),
-        coupon_rate=float(ws["B6"].value),
-        maturity=float(ws["B7"].value),
-        coupon_freq=int(ws["B8"].value),
-    )
-    y = FlatYield(j=float(ws["B9"].value), m=int(ws["B10"].value))
-
-    excel = read_excel_outputs(str(xlsx_path))
+    # single read-only open for both inputs and cached outputs
+    wb = load_workbook(str(xlsx_path), data_only=True, read_only=True)
+    try:
+        vals = _read_block(wb["Bond Toolkit"])
+    finally:
+        wb.close()
+    bond, y = _read_inputs(vals)
+    excel = _read_outputs(vals)
 
     curve = build_flat_curve(y)
     cf = cashflows(bond, stub=False)  # mirror original template (integer schedule)
     cf_pv = price_from_curve(cf, curve)
-    P = price(cf_pv)
-    mac = macaulay_duration(cf_pv)
-    mod = modified_duration_flat(mac, y)
-    conv = convexity_flat(cf_pv, y)
+    P, mac, mod, conv = metrics_flat(cf_pv, y)
 
     print("=== Inputs ===")
     print(bond, y)
@@ -15,11 +15,39 @@ Conventions:
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Tuple, Dict
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Optional, Sequence, Tuple, Dict
+import functools
 import math
+import os
+import numpy as np
 import pandas as pd
 
+# below this many elements numexpr's call overhead outweighs its vectorized pow
+_NUMEXPR_MIN_SIZE = 1 << 16
+# optional numexpr module, imported on the first large evaluation (False = not installed)
+_numexpr = None
+
+
+def _load_numexpr():
+    global _numexpr
+    if _numexpr is None:
+        try:
+            import numexpr
+            _numexpr = numexpr
+        except ImportError:  # pragma: no cover - numexpr not installed
+            _numexpr = False
+    return _numexpr
+
+
+def _df_pow(base, neg_mt: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """DF = base ** (-m t), via numexpr for large arrays when it is installed, else NumPy."""
+    if neg_mt.size >= _NUMEXPR_MIN_SIZE:
+        ne = _load_numexpr()
+        if ne:
+            return ne.evaluate("base ** neg_mt", local_dict={"base": base, "neg_mt": neg_mt}, out=out)
+    return np.power(base, neg_mt, out=out)
+
 
 @dataclass(frozen=True)
 class BondSpec:
@@ -57,6 +85,10 @@ class YieldCurve:
             raise ValueError("pillars must be strictly increasing")
         if self.m <= 0:
             raise ValueError("m must be positive")
+        # cached arrays for vectorized evaluation (frozen dataclass -> object.__setattr__)
+        object.__setattr__(self, "_p", np.asarray(self.pillars, dtype=np.float64))
+        object.__setattr__(self, "_r", np.asarray(self.rates, dtype=np.float64))
+        object.__setattr__(self, "_inv_m", 1.0 / self.m)
 
     def zero_rate(self, t: float) -> float:
         """Nominal zero rate j^(m) at time t (years)."""
@@ -65,16 +97,13 @@ class YieldCurve:
         if t >= self.pillars[-1]:
             return self.rates[-1]
 
-        # find segment
-        # linear interpolation between (t_i, r_i) and (t_{i+1}, r_{i+1})
-        for i in range(len(self.pillars)-1):
-            t0, t1 = self.pillars[i], self.pillars[i+1]
-            if t0 <= t <= t1:
-                r0, r1 = self.rates[i], self.rates[i+1]
-                w = (t - t0) / (t1 - t0)
-                return r0 + w * (r1 - r0)
-        # should never hit
-        return self.rates[-1]
+        # binary search for the segment [t_i, t_{i+1}] containing t,
+        # then linear interpolation between (t_i, r_i) and (t_{i+1}, r_{i+1})
+        i = int(np.searchsorted(self._p, t)) - 1
+        t0, t1 = self._p[i], self._p[i + 1]
+        r0, r1 = self._r[i], self._r[i + 1]
+        w = (t - t0) / (t1 - t0)
+        return float(r0 + w * (r1 - r0))
 
     def df(self, t: float) -> float:
         r = self.zero_rate(t)
@@ -83,6 +112,22 @@ class YieldCurve:
             raise ValueError(f"Invalid rate/compounding: 1 + r/m <= 0 at t={t}, r={r}, m={self.m}")
         return base ** (-self.m * t)
 
+    def df_vec(self, t: np.ndarray, neg_mt: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Vectorized DF(t) for an array of times (np.interp = same piecewise-linear/flat rule as zero_rate).
+        neg_mt: optional precomputed exponent -m*t (see CashflowArrays.neg_mt).
+        """
+        t = np.asarray(t, dtype=np.float64)
+        if neg_mt is None:
+            neg_mt = -self.m * t
+        # work in the interp output buffer: r -> 1 + r/m -> DF, no extra temporaries
+        out = np.interp(t, self._p, self._r)
+        out *= self._inv_m
+        out += 1.0
+        if (out <= 0).any():
+            raise ValueError(f"Invalid rate/compounding: 1 + r/m <= 0 for m={self.m}")
+        return _df_pow(out, neg_mt, out=out)
+
     def bump_parallel(self, bp: float) -> "YieldCurve":
         """Parallel shift by bp basis points."""
         d = bp / 10000.0
@@ -98,7 +143,92 @@ class YieldCurve:
         return YieldCurve(self.pillars, tuple(new_rates), self.m)
 
 
-def cashflows(bond: BondSpec, stub: bool = True) -> pd.DataFrame:
+@dataclass(frozen=True)
+class FlatCurve(YieldCurve):
+    """
+    YieldCurve with the same rate at every pillar: DF(t) = (1 + j/m)^(-m t), no interpolation.
+    A parallel bump stays flat; key/tenor-dependent bumps fall back to the generic YieldCurve.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+        if any(r != self.rates[0] for r in self.rates):
+            raise ValueError("FlatCurve requires all rates to be equal")
+        object.__setattr__(self, "_r0", float(self.rates[0]))
+
+    def zero_rate(self, t: float) -> float:
+        return self._r0
+
+    def df_vec(self, t: np.ndarray, neg_mt: Optional[np.ndarray] = None) -> np.ndarray:
+        if neg_mt is None:
+            neg_mt = -self.m * np.asarray(t, dtype=np.float64)
+        base = 1.0 + self._r0 * self._inv_m
+        if base <= 0:
+            raise ValueError(f"Invalid rate/compounding: 1 + r/m <= 0 for m={self.m}")
+        return _df_pow(base, neg_mt)
+
+    def bump_parallel(self, bp: float) -> "FlatCurve":
+        """Parallel shift by bp basis points."""
+        d = bp / 10000.0
+        return FlatCurve(self.pillars, tuple(r + d for r in self.rates), self.m)
+
+
+@dataclass(frozen=True, eq=False)
+class CashflowArrays:
+    """
+    Cash-flow schedule as parallel NumPy arrays (one entry per payment).
+    Immutable (cached schedules are shared); price_from_curve returns a copy with df / pv set.
+    """
+    t: np.ndarray
+    accrual: np.ndarray
+    cashflow: np.ndarray
+    coupon: np.ndarray
+    df: Optional[np.ndarray] = None
+    pv: Optional[np.ndarray] = None
+    # m -> -m*t, shared with enriched copies made by price_from_curve
+    _neg_mt: Dict[int, np.ndarray] = field(default_factory=dict, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return int(self.t.size)
+
+    def neg_mt(self, m: int) -> np.ndarray:
+        """DF exponent -m*t, computed once per compounding frequency and reused across scenarios."""
+        e = self._neg_mt.get(m)
+        if e is None:
+            e = -m * self.t
+            e.flags.writeable = False
+            self._neg_mt[m] = e
+        return e
+
+    @property
+    def k(self) -> np.ndarray:
+        return np.arange(1, self.t.size + 1)
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        cols = {"k": self.k, "t": self.t, "accrual": self.accrual, "cashflow": self.cashflow, "coupon": self.coupon}
+        if self.df is not None:
+            cols["df"] = self.df
+        if self.pv is not None:
+            cols["pv"] = self.pv
+        return cols
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Table view (k, t, accrual, cashflow, coupon[, df, pv]) for Excel export."""
+        return pd.DataFrame(self._columns())
+
+    def to_csv(self, path) -> None:
+        """
+        Write the table view as CSV straight from the arrays (np.savetxt, no DataFrame).
+        "%s" keeps the shortest round-trip repr and rows end in os.linesep (file opened with
+        newline="" so it is not translated again), matching DataFrame.to_csv(index=False).
+        """
+        cols = self._columns()
+        rec = np.rec.fromarrays(list(cols.values()), names=list(cols))
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            np.savetxt(fh, rec, fmt="%s", delimiter=",", header=",".join(cols), comments="", newline=os.linesep)
+
+
+def cashflows(bond: BondSpec, stub: bool = True) -> CashflowArrays:
     """
     Generate cash-flow schedule from t=0 to maturity.
 
@@ -106,8 +236,14 @@ def cashflows(bond: BondSpec, stub: bool = True) -> pd.DataFrame:
       times: 1/p, 2/p, ..., n/p, T where n=floor(T*p)
       accrual: dt_k = t_k - t_{k-1}
       coupon_k = FV * c * dt_k
+
+    The schedule is a pure function of (bond, stub) and is memoized; the returned arrays are read-only.
     """
-    fv, c, T, p = bond.fv, bond.coupon_rate, bond.maturity, bond.coupon_freq
+    return _cashflows_cached(bond.fv, bond.coupon_rate, bond.maturity, bond.coupon_freq, bool(stub))
+
+
+@functools.lru_cache(maxsize=32)
+def _cashflows_cached(fv: float, c: float, T: float, p: int, stub: bool) -> CashflowArrays:
     if fv <= 0 or T <= 0:
         raise ValueError("fv and maturity must be positive")
     if p <= 0:
@@ -117,61 +253,51 @@ def cashflows(bond: BondSpec, stub: bool = True) -> pd.DataFrame:
 
     n_exact = T * p
     n_full = int(math.floor(n_exact + 1e-12))
-    times: List[float] = []
-    for k in range(1, n_full + 1):
-        times.append(k / p)
-
-    if stub:
-        if abs(n_exact - n_full) > 1e-10:
-            # add final maturity time if it's not already exactly included
-            if times and abs(times[-1] - T) < 1e-12:
-                pass
-            else:
-                times.append(T)
-        else:
-            # exact schedule: last time already equals T
-            if not times or abs(times[-1] - T) > 1e-12:
-                times.append(T)
-    else:
-        # force integer number of periods
-        T_used = n_full / p
-        times = [k / p for k in range(1, n_full + 1)]
-        if abs(times[-1] - T_used) > 1e-12:
-            times.append(T_used)
-
-    rows = []
-    t_prev = 0.0
-    for i, t in enumerate(times, start=1):
-        dt = t - t_prev
-        if dt <= 0:
-            raise ValueError("Non-increasing time grid generated")
-        coupon = fv * c * dt
-        cf = coupon
-        if abs(t - T) < 1e-10:
-            cf += fv
-        rows.append({"k": i, "t": float(t), "accrual": float(dt), "cashflow": float(cf), "coupon": float(coupon)})
-        t_prev = t
-
-    return pd.DataFrame(rows)
-
-
-def price_from_curve(cf: pd.DataFrame, curve: YieldCurve) -> pd.DataFrame:
-    """Add DF and PV columns, return the enriched CF table."""
-    df = cf.copy()
-    df["df"] = df["t"].map(curve.df)
-    df["pv"] = df["cashflow"] * df["df"]
-    return df
-
-
-def price(cf_pv: pd.DataFrame) -> float:
-    return float(cf_pv["pv"].sum())
-
-
-def macaulay_duration(cf_pv: pd.DataFrame) -> float:
+    # stub: one extra slot for T when maturity is not on the 1/p grid;
+    # integer schedule (stub=False) always ends on n_full/p
+    add_T = stub and (n_full == 0 or abs(n_full / p - T) > 1e-12)
+    t = np.empty(n_full + int(add_T))
+    t[:n_full] = np.arange(1, n_full + 1, dtype=np.float64) / p
+    if add_T:
+        t[-1] = T
+
+    dt = np.diff(t, prepend=0.0)
+    if (dt <= 0).any():
+        raise ValueError("Non-increasing time grid generated")
+    coupon = fv * c * dt
+    cf = coupon.copy()
+    if abs(t[-1] - T) < 1e-10:
+        cf[-1] += fv
+
+    # shared between callers via the cache -> guard against in-place edits
+    for arr in (t, dt, cf, coupon):
+        arr.flags.writeable = False
+    return CashflowArrays(t=t, accrual=dt, cashflow=cf, coupon=coupon)
+
+
+def price_from_curve(cf: CashflowArrays, curve: YieldCurve) -> CashflowArrays:
+    """
+    Attach DF and PV arrays, return the enriched CF schedule.
+    The schedule arrays are shared with cf (no copy); only df and pv are allocated.
+    """
+    df = curve.df_vec(cf.t, cf.neg_mt(curve.m))
+    return replace(cf, df=df, pv=cf.cashflow * df)
+
+
+def price_on_curve(cf: CashflowArrays, curve: YieldCurve) -> float:
+    """Price only (no PV array) - used for scenario / bumped-curve repricing."""
+    return float(cf.cashflow @ curve.df_vec(cf.t, cf.neg_mt(curve.m)))
+
+
+def price(cf_pv: CashflowArrays) -> float:
+    return float(cf_pv.pv.sum())
+
+
+def macaulay_duration(cf_pv: CashflowArrays) -> float:
     P = price(cf_pv)
     if P == 0:
         return float("nan")
-    return float((cf_pv["t"] * cf_pv["pv"]).sum() / P)
+    return float((cf_pv.t * cf_pv.pv).sum() / P)
 
 
 def modified_duration_flat(mac_dur: float, y: FlatYield) -> float:
@@ -179,7 +305,7 @@ def modified_duration_flat(mac_dur: float, y: FlatYield) -> float:
     return float(mac_dur / (1.0 + y.j / y.m))
 
 
-def convexity_flat(cf_pv: pd.DataFrame, y: FlatYield) -> float:
+def convexity_flat(cf_pv: CashflowArrays, y: FlatYield) -> float:
     """
     Discrete convexity consistent with the original Excel template for nominal j^(m).
 
@@ -190,18 +316,41 @@ def convexity_flat(cf_pv: pd.DataFrame, y: FlatYield) -> float:
     if P == 0:
         return float("nan")
     a = 1.0 + y.j / y.m
-    return float(((cf_pv["pv"] * cf_pv["t"] * (cf_pv["t"] + 1.0 / y.m)).sum() / P) / (a * a))
+    return float(((cf_pv.pv * cf_pv.t * (cf_pv.t + 1.0 / y.m)).sum() / P) / (a * a))
 
 
-def effective_duration_convexity(bond: BondSpec, curve: YieldCurve, bump_bp: float = 1.0, stub: bool = True) -> Dict[str, float]:
+def metrics_flat(cf_pv: CashflowArrays, y: FlatYield) -> Tuple[float, float, float, float]:
+    """
+    Fused flat-yield metrics: (Price, Macaulay, Modified, Convexity) from three reductions
+    Σ pv, Σ t pv, Σ t² pv (dot products, no per-metric temporaries).
+    Same formulas as price / macaulay_duration / modified_duration_flat / convexity_flat.
+    """
+    t, pv = cf_pv.t, cf_pv.pv
+    P = float(pv.sum())
+    if P == 0:
+        nan = float("nan")
+        return P, nan, nan, nan
+    s1 = t @ pv
+    s2 = (t * t) @ pv
+    a = 1.0 + y.j / y.m
+    mac = float(s1 / P)
+    conv = float((s2 + s1 / y.m) / P / (a * a))
+    return P, mac, mac / a, conv
+
+
+def effective_duration_convexity(
+    bond: BondSpec, curve: YieldCurve, bump_bp: float = 1.0, stub: bool = True, cf: Optional[CashflowArrays] = None
+) -> Dict[str, float]:
     """
     Effective duration and convexity for a *parallel* curve shift by +/- bump_bp.
     bump_bp default 1bp for stability; you can pass 50/100bp for scenario alignment.
+    Pass a precomputed schedule as cf to skip rebuilding it from (bond, stub).
     """
-    cf = cashflows(bond, stub=stub)
-    base = price(price_from_curve(cf, curve))
-    up = price(price_from_curve(cf, curve.bump_parallel(+bump_bp)))
-    dn = price(price_from_curve(cf, curve.bump_parallel(-bump_bp)))
+    if cf is None:
+        cf = cashflows(bond, stub=stub)
+    base = price_on_curve(cf, curve)
+    up = price_on_curve(cf, curve.bump_parallel(+bump_bp))
+    dn = price_on_curve(cf, curve.bump_parallel(-bump_bp))
     dy = bump_bp / 10000.0
 
     eff_dur = (dn - up) / (2.0 * base * dy)
@@ -209,25 +358,81 @@ def effective_duration_convexity(bond: BondSpec, curve: YieldCurve, bump_bp: flo
     return {"price": base, "eff_duration": float(eff_dur), "eff_convexity": float(eff_conv)}
 
 
-def key_rate_durations(bond: BondSpec, curve: YieldCurve, bump_bp: float = 1.0, stub: bool = True) -> pd.DataFrame:
+def _rate_basis(t: np.ndarray, pillars: np.ndarray) -> np.ndarray:
+    """
+    Tent-basis matrix H (N x P) of the piecewise-linear/flat interpolation: j(t_k) = (H @ rates)[k].
+    Row k holds the interpolation weights of t_k on its two bracketing pillars.
+    """
+    n, n_p = t.size, pillars.size
+    H = np.zeros((n, n_p))
+    if n_p == 1:
+        H[:, 0] = 1.0
+        return H
+    i = np.clip(np.searchsorted(pillars, t) - 1, 0, n_p - 2)
+    w = np.clip((t - pillars[i]) / (pillars[i + 1] - pillars[i]), 0.0, 1.0)
+    rows = np.arange(n)
+    H[rows, i] = 1.0 - w
+    H[rows, i + 1] += w
+    return H
+
+
+def _price_rate_matrix(R: np.ndarray, inv_m, neg_mt: np.ndarray, cashflow: np.ndarray) -> np.ndarray:
+    """
+    Prices Σ_k CF_k * (1 + R[s, k]/m)^(-m t_k) for every row s of an (S x N) rate matrix.
+    inv_m: scalar or (S x 1) column of 1/m; neg_mt: (S x N) exponents. R is overwritten.
+    """
+    R *= inv_m
+    R += 1.0
+    if (R <= 0).any():
+        raise ValueError("Invalid rate/compounding: 1 + r/m <= 0")
+    return _df_pow(R, neg_mt, out=R) @ cashflow
+
+
+def price_on_curves(cf: CashflowArrays, curves: Sequence[YieldCurve]) -> np.ndarray:
+    """
+    Prices of one schedule under several curves sharing the same pillars (m may differ).
+    The S interpolated rate vectors come from one (S x P) @ (P x N) product with the tent basis,
+    so all S prices are a single DF-matrix times CF-vector evaluation.
+    """
+    pillars = curves[0]._p
+    if any(not np.array_equal(c._p, pillars) for c in curves):
+        raise ValueError("all curves must share the same pillars")
+    H = _rate_basis(cf.t, pillars)
+    R = np.stack([c._r for c in curves]) @ H.T
+    inv_m = np.array([c._inv_m for c in curves])[:, None]
+    neg_mt = np.stack([cf.neg_mt(c.m) for c in curves])
+    return _price_rate_matrix(R, inv_m, neg_mt, cf.cashflow)
+
+
+def key_rate_durations(
+    bond: BondSpec, curve: YieldCurve, bump_bp: float = 1.0, stub: bool = True, cf: Optional[CashflowArrays] = None
+) -> pd.DataFrame:
     """
     Key-rate durations (KRD) by bumping one curve pillar at a time.
     Returns a dataframe with columns: pillar, krd
+    Pass a precomputed schedule as cf to skip rebuilding it from (bond, stub).
+
+    Bumping pillar i by d shifts j(t) by d * H[:, i] (see _rate_basis), so all
+    P bumped curves (plus the base) are priced together as one DF matrix times the CF vector.
     """
-    cf = cashflows(bond, stub=stub)
-    base = price(price_from_curve(cf, curve))
+    if cf is None:
+        cf = cashflows(bond, stub=stub)
     dy = bump_bp / 10000.0
-    rows = []
-    for i, ten in enumerate(curve.pillars):
-        bumped = curve.bump_key(i, bump_bp)
-        pb = price(price_from_curve(cf, bumped))
-        krd = -(pb - base) / (base * dy)
-        rows.append({"pillar": float(ten), "krd": float(krd)})
-    return pd.DataFrame(rows)
-
-
-def build_flat_curve(y: FlatYield, pillars: Sequence[float] = (0.5, 1, 2, 5, 10, 20, 30)) -> YieldCurve:
-    return YieldCurve(tuple(float(t) for t in pillars), tuple(float(y.j) for _ in pillars), y.m)
+    m, t = curve.m, cf.t
+    H = _rate_basis(t, curve._p)
+    r_base = H @ curve._r
+    # row 0 = base curve, so base and bumped prices go through the exact same reduction
+    R = r_base[None, :] + dy * np.vstack([np.zeros(t.size), H.T])
+    prices = _price_rate_matrix(R, curve._inv_m, np.broadcast_to(cf.neg_mt(m), R.shape), cf.cashflow)
+    base = prices[0]
+    if base == 0:
+        raise ValueError("Base price is zero; key-rate durations are undefined")
+    krd = -(prices[1:] - base) / (base * dy)
+    return pd.DataFrame({"pillar": curve._p.copy(), "krd": krd})
+
+
+def build_flat_curve(y: FlatYield, pillars: Sequence[float] = (0.5, 1, 2, 5, 10, 20, 30)) -> FlatCurve:
+    return FlatCurve(tuple(float(t) for t in pillars), tuple(float(y.j) for _ in pillars), y.m)
 
 
 def steepener_shock_bp(t: float, short_end: float = 2.0, long_start: float = 10.0, short_bp: float = 100.0, long_bp: float = 30.0) -> float:
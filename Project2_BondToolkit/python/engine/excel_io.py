@@ -28,45 +28,56 @@ from .bond_engine import BondSpec, FlatYield, YieldCurve
 DEFAULT_SHEET = "Bond Toolkit"
 
 
+def column_values(ws, first_row: int, last_row: int, col: int = 2) -> list:
+    """
+    Values of a single-column block (e.g. B5:B10) pulled in one iter_rows pass.
+    Padded with None up to last_row: read-only sheets stop at their last used row.
+    """
+    vals = [row[0] for row in ws.iter_rows(min_row=first_row, max_row=last_row, min_col=col, max_col=col, values_only=True)]
+    vals += [None] * (last_row - first_row + 1 - len(vals))
+    return vals
+
+
 def read_inputs_xlsx(xlsx_path: str, sheet: str = DEFAULT_SHEET) -> Tuple[BondSpec, FlatYield]:
-    wb = load_workbook(xlsx_path, data_only=True)
-    if sheet not in wb.sheetnames:
-        raise ValueError(f"Sheet '{sheet}' not found in {xlsx_path}")
-    ws = wb[sheet]
+    wb = load_workbook(xlsx_path, data_only=True, read_only=True)
+    try:
+        if sheet not in wb.sheetnames:
+            raise ValueError(f"Sheet '{sheet}' not found in {xlsx_path}")
+        ws = wb[sheet]
 
-    fv = float(ws["B5"].value)
-    c = float(ws["B6"].value)
-    T = float(ws["B7"].value)
-    p = int(ws["B8"].value)
-    j = float(ws["B9"].value)
-    m = int(ws["B10"].value)
+        # B5:B10 = FV, c, T, p, j, m
+        fv, c, T, p, j, m = column_values(ws, 5, 10)
+    finally:
+        wb.close()
 
-    return BondSpec(fv=fv, coupon_rate=c, maturity=T, coupon_freq=p), FlatYield(j=j, m=m)
+    return BondSpec(fv=float(fv), coupon_rate=float(c), maturity=float(T), coupon_freq=int(p)), FlatYield(j=float(j), m=int(m))
 
 
 def read_curve_xlsx(xlsx_path: str, curve_sheet: str = "Curve", sheet: str = DEFAULT_SHEET) -> Optional[YieldCurve]:
-    wb = load_workbook(xlsx_path, data_only=True)
-    if curve_sheet not in wb.sheetnames:
-        return None
-    if sheet not in wb.sheetnames:
-        raise ValueError(f"Sheet '{sheet}' not found in {xlsx_path}")
-    ws_curve = wb[curve_sheet]
-    ws_base = wb[sheet]
-    m = int(ws_base["B10"].value)
-
-    pillars = []
-    rates = []
-    # expect header in row 1, start at row 2
-    for r in range(2, 5000):
-        t = ws_curve[f"A{r}"].value
-        y = ws_curve[f"B{r}"].value
-        if t is None and y is None:
-            break
-        if t is None or y is None:
-            # skip partially empty rows
-            continue
-        pillars.append(float(t))
-        rates.append(float(y))
+    # read-only: streaming parser, we never write back here
+    wb = load_workbook(xlsx_path, data_only=True, read_only=True)
+    try:
+        if curve_sheet not in wb.sheetnames:
+            return None
+        if sheet not in wb.sheetnames:
+            raise ValueError(f"Sheet '{sheet}' not found in {xlsx_path}")
+        ws_curve = wb[curve_sheet]
+        ws_base = wb[sheet]
+        m = int(ws_base["B10"].value)
+
+        pillars = []
+        rates = []
+        # expect header in row 1, start at row 2
+        for t, y in ws_curve.iter_rows(min_row=2, max_row=4999, max_col=2, values_only=True):
+            if t is None and y is None:
+                break
+            if t is None or y is None:
+                # skip partially empty rows
+                continue
+            pillars.append(float(t))
+            rates.append(float(y))
+    finally:
+        wb.close()
 
     if not pillars:
         return None
@@ -107,39 +118,29 @@ def inject_python_outputs(
         wb.remove(ws)
     ws = wb.create_sheet(sheet_name)
 
-    # write summary starting at A1
-    ws["A1"] = "Python Engine Outputs"
-    ws["A3"] = "Summary"
-    # header
-    headers = list(summary.keys())
-    for j, h in enumerate(headers, start=1):
-        ws.cell(row=4, column=j, value=h)
-        ws.cell(row=5, column=j, value=float(summary[h]))
-
-    # cashflows
-    start_row = 7
-    ws.cell(row=start_row, column=1, value="Cashflows")
-    df = cashflows.copy()
-    for j, col in enumerate(df.columns, start=1):
-        ws.cell(row=start_row+1, column=j, value=col)
-    for i, row in enumerate(df.itertuples(index=False), start=0):
-        for j, val in enumerate(row, start=1):
-            ws.cell(row=start_row+2+i, column=j, value=float(val) if isinstance(val, (int,float)) else val)
-
-    cur_row = start_row + 2 + len(df) + 2
+    # fresh sheet -> lay it out top to bottom with ws.append (empty list = blank row)
+    def cell_value(val):
+        return float(val) if isinstance(val, (int, float)) else val
 
     def write_df(title: str, df2: Optional[pd.DataFrame]):
-        nonlocal cur_row
         if df2 is None:
             return
-        ws.cell(row=cur_row, column=1, value=title)
-        for j, col in enumerate(df2.columns, start=1):
-            ws.cell(row=cur_row+1, column=j, value=col)
-        for i, row in enumerate(df2.itertuples(index=False), start=0):
-            for j, val in enumerate(row, start=1):
-                ws.cell(row=cur_row+2+i, column=j, value=float(val) if isinstance(val,(int,float)) else val)
-        cur_row += 2 + len(df2) + 2
-
+        ws.append([title])
+        ws.append(list(df2.columns))
+        for row in df2.itertuples(index=False):
+            ws.append([cell_value(val) for val in row])
+        ws.append([])
+        ws.append([])
+
+    # summary starting at A1
+    ws.append(["Python Engine Outputs"])
+    ws.append([])
+    ws.append(["Summary"])
+    ws.append(list(summary.keys()))
+    ws.append([float(v) for v in summary.values()])
+    ws.append([])
+
+    write_df("Cashflows", cashflows)
     write_df("Scenarios", scenarios)
     write_df("KeyRateDurations", key_rate)
 
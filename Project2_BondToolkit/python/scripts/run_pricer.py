@@ -28,8 +28,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 from engine.bond_engine import (
     BondSpec, FlatYield, YieldCurve,
     cashflows, build_flat_curve,
-    price_from_curve, price, macaulay_duration,
-    modified_duration_flat, convexity_flat,
+    price_from_curve, metrics_flat,
     effective_duration_convexity,
 )
 from engine.excel_io import read_inputs_xlsx, read_curve_xlsx, write_output_workbook, inject_python_outputs
@@ -58,16 +57,13 @@ def main():
 
     cf = cashflows(bond, stub=args.stub)
     cf_pv = price_from_curve(cf, curve)
-    P = price(cf_pv)
-    mac = macaulay_duration(cf_pv)
 
     # flat-yield metrics are only "canonical" for a flat curve (or when you want to report them anyway)
     # We compute them using the nominal rate at t = maturity (for flat this equals y.j).
     flat = FlatYield(j=curve.zero_rate(bond.maturity), m=curve.m)
-    mod = modified_duration_flat(mac, flat)
-    conv = convexity_flat(cf_pv, flat)
+    P, mac, mod, conv = metrics_flat(cf_pv, flat)
 
-    eff = effective_duration_convexity(bond, curve, bump_bp=1.0, stub=args.stub)
+    eff = effective_duration_convexity(bond, curve, bump_bp=1.0, stub=args.stub, cf=cf)
 
     summary = {
         "fv": bond.fv,
@@ -87,14 +83,17 @@ def main():
 
     # exports
     cf_csv = outdir / "cashflows.csv"
-    cf_pv.to_csv(cf_csv, index=False)
+    cf_pv.to_csv(cf_csv)
 
     summary_json = outdir / "summary.json"
     summary_json.write_text(json.dumps(summary, indent=2), encoding="utf-8")
 
+    if args.export_xlsx or args.inject_template:
+        cf_table = cf_pv.to_dataframe()
+
     if args.export_xlsx:
         out_xlsx = outdir / "bond_pricer_output.xlsx"
-        write_output_workbook(str(out_xlsx), summary=summary, cashflows=cf_pv)
+        write_output_workbook(str(out_xlsx), summary=summary, cashflows=cf_table)
 
     if args.inject_template:
         out_xlsx2 = outdir / f"{xlsx_path.stem}_with_python_outputs.xlsx"
@@ -102,7 +101,7 @@ def main():
             xlsx_in=str(xlsx_path),
             xlsx_out=str(out_xlsx2),
             summary=summary,
-            cashflows=cf_pv,
+            cashflows=cf_table,
         )
 
     print("Done.")
@@ -22,7 +22,7 @@ import pandas as pd
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from engine.bond_engine import (
-    cashflows, build_flat_curve, price_from_curve, price,
+    cashflows, build_flat_curve, price_from_curve, price_on_curves,
     effective_duration_convexity, key_rate_durations,
     apply_tenor_dependent_shock, steepener_shock_bp,
     YieldCurve,
@@ -61,33 +61,17 @@ def main():
         curve = build_flat_curve(y)
 
     cf = cashflows(bond, stub=args.stub)
-    base_cf = price_from_curve(cf, curve)
-    P0 = price(base_cf)
 
     # use effective duration/convexity for parallel-shift approximations
-    eff = effective_duration_convexity(bond, curve, bump_bp=1.0, stub=args.stub)
+    eff = effective_duration_convexity(bond, curve, bump_bp=1.0, stub=args.stub, cf=cf)
     D = eff["eff_duration"]
     C = eff["eff_convexity"]
 
-    scenarios = []
+    # collect (name, curve, dy_bp, note); all scenarios are priced in one batch below
+    specs = []
 
     def add_scenario(name: str, curve_s: YieldCurve, dy_bp: float | None = None, note: str = ""):
-        nonlocal scenarios
-        P = price(price_from_curve(cf, curve_s))
-        pct = (P / P0 - 1.0) * 100.0
-        row = {"scenario": name, "price": P, "%chg_vs_base": pct, "note": note}
-        if dy_bp is not None:
-            dy = dy_bp / 10000.0
-            est_dur = P0 * (1.0 - D * dy)
-            est_dc = P0 * (1.0 - D * dy + 0.5 * C * dy * dy)
-            row.update({
-                "dy_bp": dy_bp,
-                "est_price_dur": est_dur,
-                "est_price_durconv": est_dc,
-                "err_dur": P - est_dur,
-                "err_durconv": P - est_dc,
-            })
-        scenarios.append(row)
+        specs.append((name, curve_s, dy_bp, note))
 
     # Base
     add_scenario("Base", curve, dy_bp=0.0)
@@ -105,12 +89,33 @@ def main():
         curve_m = YieldCurve(curve.pillars, curve.rates, alt_m)
         add_scenario(f"Same nominal j, m={alt_m}", curve_m, note="changes compounding frequency only")
 
+    prices = price_on_curves(cf, [spec[1] for spec in specs])
+    P0 = float(prices[0])
+
+    scenarios = []
+    for (name, _, dy_bp, note), P in zip(specs, prices):
+        P = float(P)
+        pct = (P / P0 - 1.0) * 100.0
+        row = {"scenario": name, "price": P, "%chg_vs_base": pct, "note": note}
+        if dy_bp is not None:
+            dy = dy_bp / 10000.0
+            est_dur = P0 * (1.0 - D * dy)
+            est_dc = P0 * (1.0 - D * dy + 0.5 * C * dy * dy)
+            row.update({
+                "dy_bp": dy_bp,
+                "est_price_dur": est_dur,
+                "est_price_durconv": est_dc,
+                "err_dur": P - est_dur,
+                "err_durconv": P - est_dc,
+            })
+        scenarios.append(row)
+
     scen_df = pd.DataFrame(scenarios)
     scen_csv = outdir / "scenarios.csv"
     scen_df.to_csv(scen_csv, index=False)
 
     # Key-rate durations
-    krd = key_rate_durations(bond, curve, bump_bp=args.krd_bp, stub=args.stub)
+    krd = key_rate_durations(bond, curve, bump_bp=args.krd_bp, stub=args.stub, cf=cf)
     krd_csv = outdir / "key_rate_durations.csv"
     krd.to_csv(krd_csv, index=False)
 
@@ -128,8 +133,9 @@ def main():
 
     if args.export_xlsx:
         out_xlsx = outdir / "scenario_output.xlsx"
+        base_cf = price_from_curve(cf, curve)
         # re-use write_output_workbook: put scenarios + key-rate, cashflows omitted here (still in run_pricer)
-        write_output_workbook(str(out_xlsx), summary=summary, cashflows=base_cf, scenarios=scen_df, key_rate=krd)
+        write_output_workbook(str(out_xlsx), summary=summary, cashflows=base_cf.to_dataframe(), scenarios=scen_df, key_rate=krd)
 
     print("Done.")
     print(f"- Scenarios: {scen_csv}")